@@ -1,9 +1,28 @@
 # app.py
+import hashlib
 import json
-from typing import List, Dict, Any, Tuple
+import math
+from functools import lru_cache
+from typing import Callable, List, Dict, Any, NamedTuple, Optional, Tuple
 import operator
+import threading
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+import numpy as np
+import pandas as pd
 import streamlit as st
 
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib json module
+    orjson = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # optional speedup; batch scoring falls back to NumPy
+    njit = None
+    prange = range
+
 OPS = {
     "==": operator.eq,
     "!=": operator.ne,
@@ -15,6 +34,48 @@ OPS = {
     "not_in": lambda a, b: a not in b,
 }
 
+# Python source for each operator, used when compiling rules to predicates.
+OP_SOURCE = {
+    "==": "==",
+    "!=": "!=",
+    ">": ">",
+    ">=": ">=",
+    "<": "<",
+    "<=": "<=",
+    "in": "in",
+    "not_in": "not in",
+}
+
+KNOWN_FIELDS = ("cgpa", "co_curricular_score", "family_income", "disciplinary_actions")
+
+# Vectorized counterparts of OPS, applied to a whole column of applicants.
+OP_NUMPY = {
+    "==": np.equal,
+    "!=": np.not_equal,
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "<": np.less,
+    "<=": np.less_equal,
+    "in": lambda a, b: np.isin(a, b),
+    "not_in": lambda a, b: np.isin(a, b, invert=True),
+}
+
+# Op codes for the jitted batch evaluator (membership ops are not encodable).
+OP_CODES = {"==": 0, "!=": 1, ">": 2, ">=": 3, "<": 4, "<=": 5}
+
+# Operators whose value is a collection rather than a single number.
+MEMBERSHIP_OPS = ("in", "not_in")
+
+# Compile rules to eval-generated lambdas. Set to False where eval is not
+# allowed; rules are then interpreted through bound itemgetter/operator tuples.
+RULES_CODEGEN = True
+
+# Rules texts kept compiled per session (the current one plus a few recent ones).
+RULE_CACHE_SIZE = 4
+
+# Static selectivity ranking: narrow tests first so a rule fails as early as possible.
+SELECTIVITY = {"==": 0, "in": 0, ">=": 1, "<=": 1, ">": 1, "<": 1, "!=": 2, "not_in": 2}
+
 DEFAULT_RULES: List[Dict[str, Any]] = [
     {
         "name": "Top merit candidate",
@@ -81,30 +142,449 @@ DEFAULT_RULES: List[Dict[str, Any]] = [
 ]
 
 
-def evaluate_condition(facts: Dict[str, Any], cond: List[Any]) -> bool:
-    """Evaluate a single condition: [field, op, value]."""
-    field, op, value = cond
-    if field not in facts or op not in OPS:
+def loads_json(text: str) -> Any:
+    """Parse JSON text, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def dumps_json(obj: Any) -> str:
+    """Pretty-print JSON with a 2-space indent, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+DEFAULT_RULES_JSON = dumps_json(DEFAULT_RULES)
+
+
+def _is_number(value: Any) -> bool:
+    if not isinstance(value, (int, float)) or isinstance(value, bool):
         return False
     try:
-        return OPS[op](facts[field], value)
-    except Exception:
+        return math.isfinite(value)
+    except OverflowError:  # ints too large for a float
         return False
 
 
-def rule_matches(facts: Dict[str, Any], rule: Dict[str, Any]) -> bool:
-    return all(evaluate_condition(facts, c) for c in rule.get("conditions", []))
+def validate_rules(rules: Any) -> None:
+    """Check rule structure up front so evaluation needs no guards.
+
+    Raises a single ValueError listing every problem found.
+    """
+    if not isinstance(rules, list):
+        raise ValueError("Rules must be a JSON list")
+
+    issues = []
+    for i, rule in enumerate(rules):
+        if not isinstance(rule, dict):
+            issues.append(f"rule {i}: must be an object")
+            continue
+        where = f"rule {i} ({rule.get('name', '?')})"
+        if not isinstance(rule.get("name"), str):
+            issues.append(f"{where}: 'name' must be a string")
+        if not _is_number(rule.get("priority")):
+            issues.append(f"{where}: 'priority' must be a number")
+        action = rule.get("action")
+        if not isinstance(action, dict) or "decision" not in action or "reason" not in action:
+            issues.append(f"{where}: 'action' must have 'decision' and 'reason'")
+        conditions = rule.get("conditions")
+        if not isinstance(conditions, list):
+            issues.append(f"{where}: 'conditions' must be a list")
+            continue
+        for cond in conditions:
+            if not isinstance(cond, list) or len(cond) != 3:
+                issues.append(f"{where}: condition {cond!r} must be [field, op, value]")
+                continue
+            field, op, value = cond
+            if field not in KNOWN_FIELDS:
+                issues.append(f"{where}: unknown field {field!r}")
+            if not isinstance(op, str) or op not in OPS:
+                issues.append(f"{where}: unknown operator {op!r}")
+            elif op in MEMBERSHIP_OPS:
+                if not isinstance(value, list) or not all(_is_number(v) for v in value):
+                    issues.append(f"{where}: {op!r} needs a list of numbers, got {value!r}")
+            elif not _is_number(value):
+                issues.append(f"{where}: {op!r} needs a number, got {value!r}")
+
+    if issues:
+        raise ValueError("; ".join(issues))
+
+
+def bind_conditions(conditions: List[List[Any]]) -> Tuple[Tuple[Callable, Callable, Any], ...]:
+    """Resolve each [field, op, value] to (itemgetter(field), OPS[op], value).
+
+    Binding the getter and operator once skips the OPS lookup and the list
+    unpacking on every evaluation.
+    """
+    return tuple(
+        (operator.itemgetter(field), OPS[op], tuple(value) if op in MEMBERSHIP_OPS else value)
+        for field, op, value in conditions
+    )
+
+
+def make_matcher(conditions: List[List[Any]]) -> Callable[[Dict[str, Any]], bool]:
+    """Return a predicate interpreting the bound conditions (no eval needed)."""
+    bound = bind_conditions(conditions)
+
+    def rule_matches(facts: Dict[str, Any]) -> bool:
+        return all(op_fn(getter(facts), value) for getter, op_fn, value in bound)
+
+    return rule_matches
+
+
+@dataclass(slots=True)
+class CompiledRule:
+    """A validated rule prepared for evaluation by `preprocess_rules`."""
+    name: str
+    priority: float
+    conditions: List[List[Any]]  # most selective first
+    action: Dict[str, Any]
+    required: frozenset  # fields read by the conditions
+    predicate: Callable[[Dict[str, Any]], bool]
+
+
+def _literal(value: Any) -> str:
+    """Render a rule value as Python source, rejecting anything but plain data."""
+    if isinstance(value, bool) or value is None:
+        return repr(value)
+    if isinstance(value, (int, str)):
+        return repr(value)
+    if isinstance(value, float) and math.isfinite(value):
+        return repr(value)
+    if isinstance(value, list):
+        return "(" + "".join(_literal(v) + ", " for v in value) + ")"
+    raise ValueError(f"Unsupported value in rule condition: {value!r}")
+
+
+def _membership_literal(value: Any) -> str:
+    """Render an in/not_in value as a set display of constants.
+
+    CPython folds `x in {...}` over constants into a frozenset constant, so
+    membership is a hash probe with nothing built per call.
+    """
+    if not isinstance(value, list):
+        raise ValueError(f"Membership test needs a list, got {value!r}")
+    if not value:
+        return "()"
+    return "{" + ", ".join(_literal(v) for v in value) + "}"
+
+
+def compile_rule(rule: Dict[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+    """Compile a rule's conditions into a single predicate over facts.
+
+    Fields and operators are checked against KNOWN_FIELDS and OP_SOURCE and
+    values are rendered as literals, so the generated lambda can only ever be
+    a chain of comparisons such as `f['cgpa'] >= 3.7 and f['family_income'] <= 8000`.
+    The whole rule runs in one frame with no function calls per condition.
+    """
+    parts = []
+    for field, op, value in rule.get("conditions", []):
+        if field not in KNOWN_FIELDS:
+            raise ValueError(f"Unknown field in rule {rule.get('name')!r}: {field!r}")
+        if op not in OP_SOURCE:
+            raise ValueError(f"Unknown operator in rule {rule.get('name')!r}: {op!r}")
+        literal = _membership_literal(value) if op in MEMBERSHIP_OPS else _literal(value)
+        parts.append(f"f[{field!r}] {OP_SOURCE[op]} {literal}")
+    expr = " and ".join(parts) or "True"
+    code = compile("lambda f: " + expr, f"<rule {rule.get('name')!r}>", "eval")
+    return eval(code, {"__builtins__": {}})
+
+
+def preprocess_rules(rules: List[Dict[str, Any]], codegen: bool = True) -> List[CompiledRule]:
+    """One-time pass over validated rules before evaluation.
+
+    Returns CompiledRules sorted by descending priority (ties keep their
+    original order), with conditions reordered most selective first
+    (see SELECTIVITY). The predicate is the generated lambda from
+    `compile_rule`, or a `make_matcher` closure over the bound conditions
+    when `codegen` is False.
+    """
+    prepared = []
+    for r in sorted(rules, key=lambda r: r["priority"], reverse=True):
+        conditions = sorted(r["conditions"], key=lambda c: SELECTIVITY[c[1]])
+        if codegen:
+            predicate = compile_rule({"name": r["name"], "conditions": conditions})
+        else:
+            predicate = make_matcher(conditions)
+        prepared.append(CompiledRule(
+            name=r["name"],
+            priority=r["priority"],
+            conditions=conditions,
+            action=r["action"],
+            required=frozenset(c[0] for c in conditions),
+            predicate=predicate,
+        ))
+    return prepared
+
+
+def build_field_index(rules: List[CompiledRule]) -> Dict[Optional[str], int]:
+    """Map each field to a bitmask of the rules that reference it.
+
+    Bit i stands for rules[i]. Rules without conditions always match and are
+    listed under None.
+    """
+    index = defaultdict(int)
+    for i, r in enumerate(rules):
+        for field in r.required or {None}:
+            index[field] |= 1 << i
+    return dict(index)
 
 
-def run_rules(facts: Dict[str, Any], rules: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
-    fired = [r for r in rules if rule_matches(facts, r)]
+def _set_bits(mask: int):
+    """Yield the set bits of `mask` from lowest to highest as single-bit ints."""
+    while mask:
+        bit = mask & -mask
+        yield bit
+        mask ^= bit
 
-    if not fired:
+
+def run_rules(
+    facts: Dict[str, Any],
+    rules: List[CompiledRule],
+    field_index: Optional[Dict[Optional[str], int]] = None,
+) -> Tuple[Dict[str, Any], List[CompiledRule]]:
+    """Evaluate preprocessed rules (see `preprocess_rules`) highest priority first.
+
+    With a `field_index` only rules referencing at least one of the given
+    facts are considered. A rule needing a field missing from `facts` is
+    skipped with one subset test instead of failing mid-predicate. Fired
+    rules are collected as a bitmask over the priority-sorted rules, so the
+    winner is simply the lowest set bit.
+    """
+    if field_index is None:
+        candidates = (1 << len(rules)) - 1
+    else:
+        candidates = field_index.get(None, 0)
+        for field in facts:
+            candidates |= field_index.get(field, 0)
+
+    fired_mask = 0
+    keys = facts.keys()
+    for bit in _set_bits(candidates):
+        rule = rules[bit.bit_length() - 1]
+        if rule.required <= keys and rule.predicate(facts):
+            fired_mask |= bit
+
+    if not fired_mask:
         return ({"decision": "REVIEW", "reason": "No rule matched"}, [])
 
-    fired_sorted = sorted(fired, key=lambda r: r.get("priority", 0), reverse=True)
-    best = fired_sorted[0]["action"]
-    return best, fired_sorted
+    best = rules[(fired_mask & -fired_mask).bit_length() - 1].action
+    return best, [rules[bit.bit_length() - 1] for bit in _set_bits(fired_mask)]
+
+
+def freeze_facts(facts: Dict[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+    """Hashable, order-independent form of a facts dict."""
+    return tuple(sorted(facts.items()))
+
+
+def make_evaluator(
+    rules: List[CompiledRule],
+    field_index: Optional[Dict[Optional[str], int]] = None,
+    maxsize: int = 1024,
+) -> Callable[[Tuple[Tuple[str, Any], ...]], Tuple[Dict[str, Any], List[CompiledRule]]]:
+    """Return `run_rules` memoized on frozen facts (see `freeze_facts`).
+
+    Each evaluator is tied to one ruleset version, so the frozen facts alone
+    key the cache. Results are shared between calls and must not be mutated.
+    """
+    @lru_cache(maxsize=maxsize)
+    def evaluate(frozen_facts: Tuple[Tuple[str, Any], ...]) -> Tuple[Dict[str, Any], List[CompiledRule]]:
+        return run_rules(dict(frozen_facts), rules, field_index=field_index)
+
+    return evaluate
+
+
+class RuleBounds(NamedTuple):
+    """Numeric rule conditions packed as per-field intervals over KNOWN_FIELDS."""
+    bounds: np.ndarray  # (n_rules, n_fields, 2) float64: inclusive [lo, hi]
+    active: np.ndarray  # (n_rules, n_fields) bool: field constrained by the rule
+    slow: List[Tuple[int, int, str, Any]]  # (rule, field, op, value) for !=, in, not_in
+
+
+def build_bounds(rules: List[CompiledRule]) -> RuleBounds:
+    """Collapse each rule's ==, <, <=, >, >= conditions into one interval per field.
+
+    Strict bounds become inclusive via np.nextafter, which is exact for float64
+    facts. Conditions that are not intervals go to the `slow` list.
+    """
+    n_fields = len(KNOWN_FIELDS)
+    bounds = np.empty((len(rules), n_fields, 2))
+    bounds[..., 0] = -np.inf
+    bounds[..., 1] = np.inf
+    active = np.zeros((len(rules), n_fields), dtype=bool)
+    slow = []
+    for i, r in enumerate(rules):
+        for field, op, value in r.conditions:
+            j = KNOWN_FIELDS.index(field)
+            if op in ("!=", "in", "not_in"):
+                slow.append((i, j, op, value))
+                continue
+            active[i, j] = True
+            if op in ("==", ">=", ">"):
+                lo = np.nextafter(value, np.inf) if op == ">" else value
+                bounds[i, j, 0] = max(bounds[i, j, 0], lo)
+            if op in ("==", "<=", "<"):
+                hi = np.nextafter(value, -np.inf) if op == "<" else value
+                bounds[i, j, 1] = min(bounds[i, j, 1], hi)
+    return RuleBounds(bounds, active, slow)
+
+
+def match_bounds(values: np.ndarray, table: RuleBounds) -> np.ndarray:
+    """Return which rules fire for fact vectors shaped (..., n_fields) as (..., n_rules).
+
+    `values` holds facts in KNOWN_FIELDS order, with NaN for a missing fact
+    (e.g. a blank CSV cell). As in `run_rules`, a rule reading a missing
+    fact does not fire; fields a rule does not read are ignored.
+    """
+    x = values[..., None, :]
+    ok = ((x >= table.bounds[..., 0]) & (x <= table.bounds[..., 1])) | ~table.active
+    fired = ok.all(axis=-1)
+    for i, j, op, value in table.slow:
+        # Interval checks are already False for NaN; != and not_in are not.
+        column = values[..., j]
+        fired[..., i] &= ~np.isnan(column) & OP_NUMPY[op](column, value)
+    return fired
+
+
+def encode_rules(rules: List[CompiledRule]) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+    """Pack preprocessed rules into arrays for `_evaluate_all`.
+
+    Returns (op_codes, values, field_idx, n_conds), where the first three are
+    (n_rules, max_conditions) and padded past each rule's `n_conds`, or None
+    when a rule uses an operator without an OP_CODES entry.
+    """
+    n_conds = np.array([len(r.conditions) for r in rules], dtype=np.int64)
+    width = int(n_conds.max()) if len(rules) else 0
+    op_codes = np.zeros((len(rules), width), dtype=np.int8)
+    values = np.zeros((len(rules), width), dtype=np.float64)
+    field_idx = np.zeros((len(rules), width), dtype=np.int64)
+    for i, r in enumerate(rules):
+        for c, (field, op, value) in enumerate(r.conditions):
+            if op not in OP_CODES:
+                return None
+            op_codes[i, c] = OP_CODES[op]
+            values[i, c] = value
+            field_idx[i, c] = KNOWN_FIELDS.index(field)
+    return op_codes, values, field_idx, n_conds
+
+
+def _evaluate_all(facts_matrix, op_codes, values, field_idx, n_conds):
+    """Index of the first (highest-priority) rule each applicant fires, or -1.
+
+    Written as plain loops with explicit `if` cascades so Numba can compile it;
+    applicants are spread across threads with `prange`. A NaN fact (blank
+    CSV cell) is missing, so no condition on it holds, matching `match_bounds`.
+    """
+    n_applicants = facts_matrix.shape[0]
+    winners = np.full(n_applicants, -1, dtype=np.int64)
+    for a in prange(n_applicants):
+        for r in range(op_codes.shape[0]):
+            ok = True
+            for c in range(n_conds[r]):
+                x = facts_matrix[a, field_idx[r, c]]
+                v = values[r, c]
+                op = op_codes[r, c]
+                if np.isnan(x):
+                    ok = False
+                elif op == 0:
+                    ok = x == v
+                elif op == 1:
+                    ok = x != v
+                elif op == 2:
+                    ok = x > v
+                elif op == 3:
+                    ok = x >= v
+                elif op == 4:
+                    ok = x < v
+                else:
+                    ok = x <= v
+                if not ok:
+                    break
+            if ok:
+                winners[a] = r
+                break
+    return winners
+
+
+if njit is not None:
+    _evaluate_all = njit(parallel=True, cache=True)(_evaluate_all)
+
+
+@st.cache_resource
+def _kernel_lock() -> threading.Lock:
+    """Process-wide lock serializing calls into the parallel Numba kernel.
+
+    Numba's workqueue threading layer aborts the process on concurrent
+    parallel launches, and every Streamlit session runs in its own thread.
+    The script is re-executed per session and rerun, so a plain module-level
+    lock would not be shared; st.cache_resource makes it a singleton.
+    """
+    return threading.Lock()
+
+
+def run_rules_batch(df: pd.DataFrame, rules: List[CompiledRule]) -> pd.DataFrame:
+    """Evaluate preprocessed rules for every applicant (row) of `df` at once.
+
+    With Numba installed and only OP_CODES operators in use, the jitted
+    `_evaluate_all` finds each winner directly. Otherwise interval conditions
+    are checked together through `build_bounds` and `match_bounds`, giving an
+    (applicants x rules) boolean matrix. Returns the decision, reason and
+    winning rule per applicant, indexed like `df`.
+    """
+    missing = sorted(frozenset().union(*(r.required for r in rules)) - set(df.columns))
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+
+    values = np.column_stack([
+        df[f].to_numpy(dtype=float) if f in df.columns else np.full(len(df), np.nan)
+        for f in KNOWN_FIELDS
+    ])
+    encoded = encode_rules(rules) if njit is not None else None
+    if encoded is not None:
+        with _kernel_lock():
+            winner = _evaluate_all(values, *encoded)
+        winner[winner < 0] = len(rules)
+    else:
+        # One extra always-true column stands in for "no rule matched", so argmax
+        # (first True per row) picks the highest-priority fired rule, since
+        # preprocessed rules are priority-sorted, or the fallback.
+        masks = np.ones((len(df), len(rules) + 1), dtype=bool)
+        masks[:, :-1] = match_bounds(values, build_bounds(rules))
+        winner = masks.argmax(axis=1)
+
+    decisions = np.array([r.action["decision"] for r in rules] + ["REVIEW"], dtype=object)
+    reasons = np.array([r.action["reason"] for r in rules] + ["No rule matched"], dtype=object)
+    names = np.array([r.name for r in rules] + [""], dtype=object)
+    return pd.DataFrame(
+        {"decision": decisions[winner], "reason": reasons[winner], "rule": names[winner]},
+        index=df.index,
+    )
+
+
+def load_rules(text: str) -> Tuple[List[Dict[str, Any]], List[CompiledRule], Callable, str]:
+    """Parse, validate and compile rules text, keyed by its hash across reruns.
+
+    Only the RULE_CACHE_SIZE most recently used rules texts are kept per
+    session. Returns (parsed rules, compiled rules, memoized evaluator,
+    pretty-printed JSON).
+    """
+    key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+    cache = st.session_state.setdefault("rule_cache", OrderedDict())
+    if key in cache:
+        cache.move_to_end(key)
+    else:
+        parsed = loads_json(text)
+        validate_rules(parsed)
+        compiled = preprocess_rules(parsed, codegen=RULES_CODEGEN)
+        evaluate = make_evaluator(compiled, build_field_index(compiled))
+        # Unedited defaults are already pretty-printed; skip the re-dump.
+        pretty = DEFAULT_RULES_JSON if text == DEFAULT_RULES_JSON else dumps_json(parsed)
+        cache[key] = (parsed, compiled, evaluate, pretty)
+        while len(cache) > RULE_CACHE_SIZE:
+            cache.popitem(last=False)
+    return cache[key]
 
 
 ## Streamlit UI
@@ -113,7 +593,8 @@ st.set_page_config(page_title="Scholarship Rule-Based System", page_icon="", lay
 st.title("🎓 Scholarship Advisory Rule-Based System")
 st.caption("Enter applicant data, edit rules (optional), and evaluate eligibility.")
 
-with st.sidebar:
+# Inputs live in a form so editing them doesn't rerun the script until Evaluate is pressed.
+with st.sidebar.form("eval_form"):
     st.header("Applicant Information")
 
     cgpa = st.number_input("CGPA", min_value=0.0, max_value=4.0, step=0.01, value=3.2)
@@ -123,10 +604,9 @@ with st.sidebar:
 
     st.divider()
     st.header("Scholarship Rules (JSON)")
-    default_json = json.dumps(DEFAULT_RULES, indent=2)
-    rules_text = st.text_area("Edit rules here", value=default_json, height=300)
+    rules_text = st.text_area("Edit rules here", value=DEFAULT_RULES_JSON, height=300)
 
-    run = st.button("Evaluate", type="primary")
+    run = st.form_submit_button("Evaluate", type="primary")
 
 facts = {
     "cgpa": float(cgpa),
@@ -140,47 +620,75 @@ st.json(facts)
 
 # Load rules safely
 try:
-    rules = json.loads(rules_text)
-    assert isinstance(rules, list)
+    rules, compiled_rules, evaluate, rules_json = load_rules(rules_text)
 except Exception as e:
     st.error(f"Invalid rules JSON. Using default scholarship rules. Error: {e}")
-    rules = DEFAULT_RULES
+    rules, compiled_rules, evaluate, rules_json = load_rules(DEFAULT_RULES_JSON)
 
 st.subheader("Active Rules")
-with st.expander("Show rules", expanded=False):
-    st.code(json.dumps(rules, indent=2), language="json")
+# A collapsed expander still ships its contents to the browser, so only
+# render the (hash-cached) JSON when asked for.
+if st.toggle("Show rules", key="show_rules"):
+    st.code(rules_json, language="json")
 
 st.divider()
 
-# Run evaluation
+single_tab, batch_tab = st.tabs(["Single Applicant", "Batch (CSV)"])
+
+# Inputs only change when the form is submitted, so once it has been the
+# (memoized) result stays valid across reruns from widgets outside the form.
 if run:
-    action, fired = run_rules(facts, rules)
-
-    col1, col2 = st.columns([1, 1])
-    with col1:
-        st.subheader("Final Scholarship Decision")
-        decision = action["decision"]
-        reason = action["reason"]
-
-        if decision == "AWARD_FULL":
-            st.success(f"FULL SCHOLARSHIP — {reason}")
-        elif decision == "AWARD_PARTIAL":
-            st.info(f"PARTIAL SCHOLARSHIP — {reason}")
-        elif decision == "REJECT":
-            st.error(f"REJECT — {reason}")
-        else:
-            st.warning(f"REVIEW — {reason}")
+    st.session_state["evaluated"] = True
+
+# Run evaluation
+with single_tab:
+    if st.session_state.get("evaluated", False):
+        action, fired = evaluate(freeze_facts(facts))
+
+        col1, col2 = st.columns([1, 1])
+        with col1:
+            st.subheader("Final Scholarship Decision")
+            decision = action["decision"]
+            reason = action["reason"]
+
+            if decision == "AWARD_FULL":
+                st.success(f"FULL SCHOLARSHIP — {reason}")
+            elif decision == "AWARD_PARTIAL":
+                st.info(f"PARTIAL SCHOLARSHIP — {reason}")
+            elif decision == "REJECT":
+                st.error(f"REJECT — {reason}")
+            else:
+                st.warning(f"REVIEW — {reason}")
+
+        with col2:
+            st.subheader("Matched Rules (Highest Priority First)")
+            if not fired:
+                st.info("No rules matched.")
+            else:
+                for i, r in enumerate(fired, start=1):
+                    st.write(f"**{i}. {r.name}** | priority={r.priority}")
+                    st.caption(f"Action: {r.action}")
+                    with st.expander("Conditions"):
+                        for cond in r.conditions:
+                            st.code(str(cond))
+    else:
+        st.info("Enter values and click **Evaluate** to determine scholarship eligibility.")
+
+with batch_tab:
+    st.caption(f"Upload a CSV with one applicant per row and columns: {', '.join(KNOWN_FIELDS)}.")
+    uploaded = st.file_uploader("Applicants CSV", type="csv")
 
-    with col2:
-        st.subheader("Matched Rules (Highest Priority First)")
-        if not fired:
-            st.info("No rules matched.")
+    if uploaded is not None:
+        try:
+            applicants = pd.read_csv(uploaded)
+            results = applicants.join(run_rules_batch(applicants, compiled_rules), rsuffix="_result")
+        except ValueError as e:
+            st.error(f"Cannot evaluate uploaded applicants. Error: {e}")
         else:
-            for i, r in enumerate(fired, start=1):
-                st.write(f"**{i}. {r['name']}** | priority={r['priority']}")
-                st.caption(f"Action: {r['action']}")
-                with st.expander("Conditions"):
-                    for cond in r["conditions"]:
-                        st.code(str(cond))
-else:
-    st.info("Enter values and click **Evaluate** to determine scholarship eligibility.")
+            st.dataframe(results, use_container_width=True)
+            st.download_button(
+                "Download results",
+                results.to_csv(index=False),
+                file_name="scholarship_decisions.csv",
+                mime="text/csv",
+            )